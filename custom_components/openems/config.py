@@ -1,99 +1,218 @@
 """Load additional config options from json files."""
 
-import json
+from functools import cache, cached_property
 from pathlib import Path
 import re
-from typing import Any
+from typing import Any, NamedTuple
 
-ENCODING = "utf-8"
+import orjson
+
+CONFIG_DIR = Path(__file__).parent / "config"
+# key of the precompiled component_regexp, stored next to the original string
+COMPILED_REGEXP = "_compiled"
+# key of the channel definitions of an entry, indexed by channel id
+CHANNELS_BY_ID = "_channels_by_id"
+# key of the update group rules of an entry, indexed by channel
+RULES_BY_CHANNEL = "_rules_by_channel"
+
+
+def _load(file_name: str) -> list[dict]:
+    """Read and parse a json file of the config directory."""
+    return orjson.loads((CONFIG_DIR / file_name).read_bytes())
+
+
+def _compile_regexps(entries: list[dict]) -> list[dict]:
+    """Precompile the component regexp of each config entry."""
+    for entry in entries:
+        entry[COMPILED_REGEXP] = re.compile(entry["component_regexp"])
+    return entries
+
+
+def _union_regexp(entries: list[dict]) -> re.Pattern:
+    """Combine the component regexps of all entries into one alternation."""
+    return re.compile("|".join(f"(?:{e['component_regexp']})" for e in entries))
+
+
+def _index_channels(entries: list[dict]) -> list[dict]:
+    """Index the channel definitions of each config entry by their id."""
+    for entry in entries:
+        entry[CHANNELS_BY_ID] = {
+            channel["id"]: channel for channel in entry["channels"]
+        }
+    return entries
+
+
+def _index_rules(entries: list[dict]) -> list[dict]:
+    """Index the update group rules of each config entry by their channel."""
+    for entry in entries:
+        rules: dict[str, dict] = {}
+        for rule in entry["rules"]:
+            # the first rule of a channel wins
+            rules.setdefault(rule["channel"], rule)
+        entry[RULES_BY_CHANNEL] = rules
+    return entries
+
+
+class PropertyConfig(NamedTuple):
+    """Enum, time and number config of a component channel."""
+
+    options: list[str] | None = None
+    is_time: bool | None = None
+    limit: dict[str, str] | None = None
+    multiplier: str | None = None
+
+
+# config of channels without any enum, time or number config
+NO_PROPERTY_CONFIG = PropertyConfig()
 
 
 class OpenEMSConfig:
     """Load additional config options from json files."""
 
     def __init__(self) -> None:
-        """Initialize and read json files."""
-        path = Path(__file__).parent / "config"
-        with (path / "default_channels.json").open(encoding=ENCODING) as channel_file:
-            self.default_channels = json.load(channel_file)
-        with (path / "enum_options.json").open(encoding=ENCODING) as enum_file:
-            self.enum_options = json.load(enum_file)
-        with (path / "time_options.json").open(encoding=ENCODING) as time_file:
-            self.time_options = json.load(time_file)
-        with (path / "number_properties.json").open(encoding=ENCODING) as number_file:
-            self.number_properties = json.load(number_file)
-        with (path / "component_update_groups.json").open(
-            encoding=ENCODING
-        ) as groups_file:
-            self.update_groups = json.load(groups_file)
-        with (path / "combined_sensors.json").open(encoding=ENCODING) as combined_file:
-            self.combined_sensors = json.load(combined_file)
-
-    def _get_config_property(self, dict, property, component_name, channel_name):
-        """Return dict property for a given component/channel."""
-        for component_conf in dict:
-            comp_regex = component_conf["component_regexp"]
-            if re.fullmatch(comp_regex, component_name):
-                for channel in component_conf["channels"]:
-                    if channel["id"] == channel_name:
-                        return channel.get(property)
-        return None
+        """Initialize the caches, the json files are read on first use."""
+        # config entries matching a component, keyed by (id(config list), component)
+        self._matching_entries_cache: dict[tuple[int, str], list[dict]] = {}
+        # merged property configs of a component, keyed by component and channel
+        self._property_configs_cache: dict[str, dict[str, PropertyConfig]] = {}
+
+    @cached_property
+    def default_channels(self) -> list[dict]:
+        """Channels enabled by default, per component regexp."""
+        entries = _compile_regexps(_load("default_channels.json"))
+        # is_channel_enabled only tests for membership
+        for entry in entries:
+            entry["channels"] = frozenset(entry["channels"])
+        return entries
+
+    @cached_property
+    def enum_options(self) -> list[dict]:
+        """Enum options of channels, per component regexp."""
+        return _index_channels(_compile_regexps(_load("enum_options.json")))
+
+    @cached_property
+    def time_options(self) -> list[dict]:
+        """Channels to be shown as time, per component regexp."""
+        return _index_channels(_compile_regexps(_load("time_options.json")))
+
+    @cached_property
+    def number_properties(self) -> list[dict]:
+        """Limits and multipliers of number channels, per component regexp."""
+        return _index_channels(_compile_regexps(_load("number_properties.json")))
+
+    @cached_property
+    def update_groups(self) -> list[dict]:
+        """Channels to be updated together, per component regexp."""
+        return _index_rules(_compile_regexps(_load("component_update_groups.json")))
+
+    @cached_property
+    def combined_sensors(self) -> list[dict]:
+        """Sensors derived from other channels, per component regexp."""
+        return _compile_regexps(_load("combined_sensors.json"))
+
+    # single patterns to check if any entry of a config list matches a component
+    @cached_property
+    def _default_channels_any(self) -> re.Pattern:
+        return _union_regexp(self.default_channels)
+
+    @cached_property
+    def _update_groups_any(self) -> re.Pattern:
+        return _union_regexp(self.update_groups)
+
+    def _matching_entries(self, entries: list[dict], component_name: str) -> list[dict]:
+        """Return all entries of a config list matching the given component."""
+        key = (id(entries), component_name)
+        if (matching := self._matching_entries_cache.get(key)) is None:
+            matching = [
+                entry
+                for entry in entries
+                if entry[COMPILED_REGEXP].fullmatch(component_name)
+            ]
+            self._matching_entries_cache[key] = matching
+        return matching
+
+    def _property_configs(self, component_name: str) -> dict[str, PropertyConfig]:
+        """Return the merged enum, time and number configs of a component by channel."""
+        if (configs := self._property_configs_cache.get(component_name)) is None:
+            merged: dict[str, dict[str, Any]] = {}
+            for entries in (
+                self.enum_options,
+                self.time_options,
+                self.number_properties,
+            ):
+                # within one config list, the first matching entry wins
+                found: dict[str, dict] = {}
+                for entry in self._matching_entries(entries, component_name):
+                    for channel_id, channel in entry[CHANNELS_BY_ID].items():
+                        found.setdefault(channel_id, channel)
+                for channel_id, channel in found.items():
+                    merged.setdefault(channel_id, {}).update(channel)
+            configs = {
+                channel_id: PropertyConfig(
+                    options=channel.get("options"),
+                    is_time=channel.get("is_time"),
+                    limit=channel.get("limit"),
+                    multiplier=channel.get("multiplier"),
+                )
+                for channel_id, channel in merged.items()
+            }
+            self._property_configs_cache[component_name] = configs
+        return configs
+
+    def resolve(self, component_name, channel_name) -> PropertyConfig:
+        """Return the merged enum, time and number config of a component/channel."""
+        return self._property_configs(component_name).get(
+            channel_name, NO_PROPERTY_CONFIG
+        )
 
     def get_enum_options(self, component_name, channel_name) -> list[str] | None:
         """Return option string list for a given component/channel."""
-        return self._get_config_property(
-            self.enum_options, "options", component_name, channel_name
-        )
+        return self.resolve(component_name, channel_name).options
 
     def is_time_property(self, component_name, channel_name) -> list[str] | None:
         """Return True if given component/channel is marked as time."""
-        return self._get_config_property(
-            self.time_options, "is_time", component_name, channel_name
-        )
+        return self.resolve(component_name, channel_name).is_time
 
     def get_number_limit(self, component_name, channel_name) -> dict | None:
         """Return limit definition for a given component/channel."""
-        return self._get_config_property(
-            self.number_properties, "limit", component_name, channel_name
-        )
+        return self.resolve(component_name, channel_name).limit
 
     def get_number_multiplier(self, component_name, channel_name) -> dict | None:
         """Return multiplier for a given component/channel."""
-        return self._get_config_property(
-            self.number_properties, "multiplier", component_name, channel_name
-        )
+        return self.resolve(component_name, channel_name).multiplier
 
     def is_component_enabled(self, comp_name: str) -> bool:
         """Return if there is at least one channel enabled by default."""
-        for entry in self.default_channels:
-            if re.fullmatch(entry["component_regexp"], comp_name):
-                return True
-
-        return False
+        return self._default_channels_any.fullmatch(comp_name) is not None
 
     def is_channel_enabled(self, comp_name, chan_name) -> bool:
         """Return True if the channel is enabled by default."""
-        for entry in self.default_channels:
-            if re.fullmatch(entry["component_regexp"], comp_name):
-                if chan_name in entry["channels"]:
-                    return True
+        for entry in self._matching_entries(self.default_channels, comp_name):
+            if chan_name in entry["channels"]:
+                return True
 
         return False
 
     def update_group_members(self, comp_name, chan_name) -> tuple[list[str], Any]:
         """Return list of all update group members and the condition value."""
-        for entry in self.update_groups:
-            if re.fullmatch(entry["component_regexp"], comp_name):
-                for rule in entry["rules"]:
-                    if rule["channel"] == chan_name:
-                        return rule["requires"], rule.get("when")
+        if not self._update_groups_any.fullmatch(comp_name):
+            return [], None
+        for entry in self._matching_entries(self.update_groups, comp_name):
+            if (rule := entry[RULES_BY_CHANNEL].get(chan_name)) is not None:
+                return rule["requires"], rule.get("when")
 
         return [], None
 
     def get_combined_sensors(self, comp_name) -> list[dict]:
         """Return list of combined sensors for given component."""
-        for entry in self.combined_sensors:
-            if re.fullmatch(entry["component_regexp"], comp_name):
-                return entry["combined_sensors"]
+        if matching := self._matching_entries(self.combined_sensors, comp_name):
+            # the first matching entry wins
+            return matching[0]["combined_sensors"]
 
         return []
+
+
+@cache
+def get_config() -> OpenEMSConfig:
+    """Return the config instance, parsing the json files only once per process."""
+    return OpenEMSConfig()
@@ -43,6 +43,11 @@ from .openems import CONFIG, OpenEMSBackend
 _LOGGER = logging.getLogger(__name__)
 
 
+def _rpc_error_text(err: jsonrpc_base.jsonrpc.JSONRPCError) -> str:
+    """Return "<code>: <message>" of a jsonrpc error, which may carry fewer args."""
+    return ": ".join(str(arg) for arg in err.args[:2])
+
+
 class OpenEMSConfigFlow(ConfigFlow, domain=c.DOMAIN):
     """Handle a config flow for HA OpenEMS."""
 
@@ -179,7 +184,7 @@ class OpenEMSConfigFlow(ConfigFlow, domain=c.DOMAIN):
                 # connect
                 await asyncio.wait_for(connection.connect_to_server(), timeout=2)
             except jsonrpc_base.TransportError as te:
-                errors[CONF_HOST] = f"{te.args[0]}: {te.args[1]}"
+                errors[CONF_HOST] = _rpc_error_text(te)
                 return self._show_form(user_input, errors)
 
             try:
@@ -188,7 +193,7 @@ class OpenEMSConfigFlow(ConfigFlow, domain=c.DOMAIN):
                     connection.login_to_server(), timeout=2
                 )
             except jsonrpc_base.jsonrpc.ProtocolError as pe:
-                errors[CONF_PASSWORD] = f"{pe.args[0]}: {pe.args[1]}"
+                errors[CONF_PASSWORD] = _rpc_error_text(pe)
                 return self._show_form(user_input, errors)
 
             try:
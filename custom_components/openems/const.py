@@ -30,6 +30,13 @@ CONN_TYPE_REST: str = "rest"
 QUERY_CONFIG_VIA_REST: bool = False
 
 CURRENT_DATA_TIMEOUT_SECONDS = 60
+# entities keep their last values for this time after a connection loss
+UNAVAILABLE_GRACE_PERIOD_SECONDS = 30
+
+# getEdges is requested as one single page, large enough for any realistic account
+GET_EDGES_LIMIT = 1000
+# maximum number of getChannelsOfComponent requests sent to an edge in parallel
+MAX_PARALLEL_CHANNEL_REQUESTS = 8
 
 
 class AdvancedOptions(TypedDict):
@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Callable
 import contextlib
+import itertools
 import logging
 import time
 from typing import TypedDict
@@ -11,7 +12,12 @@ import jsonrpc_base
 import jsonrpc_websocket
 from yarl import URL
 
-from .const import CONN_TYPE_CUSTOM_URL, CURRENT_DATA_TIMEOUT_SECONDS
+from .const import (
+    CONN_TYPE_CUSTOM_URL,
+    CURRENT_DATA_TIMEOUT_SECONDS,
+    GET_EDGES_LIMIT,
+    MAX_PARALLEL_CHANNEL_REQUESTS,
+)
 from .helpers import connection_url, wrap_jsonrpc
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +33,10 @@ class ConnectionProperties(TypedDict):
     username: str
 
 
+def _ignore_edge_rpc(**kwargs) -> None:
+    """Drop edge notifications while no handler is installed."""
+
+
 class OpenEMSWebSocketConnection:
     """Class to manage a websocket connection to an OpenEMS system."""
 
@@ -49,6 +59,13 @@ class OpenEMSWebSocketConnection:
         self.rpc_server_task: asyncio.Task | None = None
         self._reconnect_task: asyncio.Task | None = None
         self._last_data_received: float = time.time()
+        # the edge only applies subscribeChannels requests with an increasing count
+        self._subscription_counter = itertools.count()
+        # channels of the live subscription, kept while channels are read once
+        self.subscribed_channels: frozenset[str] = frozenset()
+        # serializes changes of the channel subscription, which replace the full set
+        self.subscription_lock = asyncio.Lock()
+        self._edge_rpc_handler: Callable[..., None] = _ignore_edge_rpc
 
     async def connect_to_server(self):
         "Establish websocket connection."
@@ -62,22 +79,51 @@ class OpenEMSWebSocketConnection:
             username=self.username, password=self.password
         )
 
-    def enable_reconnect(self, connection_lost_callback: Callable):
+    def enable_reconnect(
+        self,
+        connection_lost_callback: Callable,
+        reconnected_callback: Callable | None = None,
+    ):
         """Start a tasks which checks for connection losses tries to reconnect afterwards."""
+        if self._reconnect_task and not self._reconnect_task.done():
+            # a second reconnect loop would race the first one on the same connection
+            return
         self._reconnect_task = asyncio.create_task(
-            self._reconnect_forever(connection_lost_callback)
+            self._reconnect_forever(connection_lost_callback, reconnected_callback)
         )
 
+    def set_edge_rpc_handler(self, handler: Callable[..., None]) -> None:
+        """Install the handler for edgeRpc notifications."""
+        self._edge_rpc_handler = handler
+        self.rpc_server.edgeRpc = handler
+
+    def next_subscription_count(self) -> int:
+        """Return the count to use for the next subscribeChannels request."""
+        return next(self._subscription_counter)
+
     def notify_data_received(self) -> None:
         """Store the timestamp of the last received data. Used for connection loss detection."""
         self._last_data_received = time.time()
 
+    def seconds_since_data_received(self) -> float:
+        """Return the time passed since data was received last."""
+        return time.time() - self._last_data_received
+
+    @property
+    def edge_rpc_handler(self) -> Callable[..., None]:
+        """The installed handler for edgeRpc notifications."""
+        return self._edge_rpc_handler
+
     @property
     def reconnect_task(self) -> asyncio.Task | None:
         """The active reconnect task, if any."""
         return self._reconnect_task
 
-    async def _reconnect_forever(self, connection_lost_callback: Callable):
+    async def _reconnect_forever(
+        self,
+        connection_lost_callback: Callable,
+        reconnected_callback: Callable | None = None,
+    ):
         while True:
             # check for an existing connection
             if self.rpc_server_task:
@@ -118,6 +164,8 @@ class OpenEMSWebSocketConnection:
                 await self.login_to_server()
                 _LOGGER.info("Connection to host %s reestablished",
                              self.conn_url.host)
+                if reconnected_callback is not None:
+                    reconnected_callback()
             except (
                 jsonrpc_base.jsonrpc.TransportError,
                 jsonrpc_base.jsonrpc.ProtocolError,
@@ -146,6 +194,8 @@ class OpenEMSConfigReader:
         """Initialize OpenEMS entry data."""
         self.connection: OpenEMSWebSocketConnection = connection
         self.edge_id: str | None = edge_id
+        # running one-shot channel reads, shared by callers requesting the same channels
+        self._pending_channel_reads: dict[frozenset[str], asyncio.Task[dict]] = {}
 
     def set_edge_id(self, edge_id: str):
         """Set the edge ID to be used for further data requests."""
@@ -174,105 +224,159 @@ class OpenEMSConfigReader:
 
     async def read_edge_channels(self, components):
         """Load channels of each component."""
-        for component_id in list(components):
-            edge_component_call = wrap_jsonrpc(
-                "getChannelsOfComponent",
-                componentId=component_id,
-            )
-            try:
-                edge_call = wrap_jsonrpc(
-                    "componentJsonApi",
-                    componentId="_componentManager",
-                    payload=edge_component_call,
-                )
-                r = await self.connection.rpc_server.edgeRpc(
-                    edgeId=self.edge_id,
-                    payload=edge_call,
-                )
-                components[component_id]["channels"] = r["payload"]["result"][
-                    "channels"
-                ]
-            except (
-                jsonrpc_base.jsonrpc.TransportError,
-                jsonrpc_base.jsonrpc.ProtocolError,
+        component_ids = list(components)
+        # send the requests concurrently, but do not flood the edge on large systems
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_CHANNEL_REQUESTS)
+
+        async def _read_limited(component_id: str) -> list[dict]:
+            async with semaphore:
+                return await self._read_component_channels(component_id)
+
+        results = await asyncio.gather(
+            *(_read_limited(c) for c in component_ids),
+            return_exceptions=True,
+        )
+        for component_id, result in zip(component_ids, results, strict=True):
+            if isinstance(
+                result,
+                (
+                    jsonrpc_base.jsonrpc.TransportError,
+                    jsonrpc_base.jsonrpc.ProtocolError,
+                ),
             ):
                 _LOGGER.warning(
                     "_read_edge_channels: could not read channels of component %s, skipping",
                     component_id,
                 )
                 del components[component_id]
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                components[component_id]["channels"] = result
+
+    async def _read_component_channels(self, component_id: str) -> list[dict]:
+        """Request the channels of a single component."""
+        edge_component_call = wrap_jsonrpc(
+            "getChannelsOfComponent",
+            componentId=component_id,
+        )
+        edge_call = wrap_jsonrpc(
+            "componentJsonApi",
+            componentId="_componentManager",
+            payload=edge_component_call,
+        )
+        r = await self.connection.rpc_server.edgeRpc(
+            edgeId=self.edge_id,
+            payload=edge_call,
+        )
+        return r["payload"]["result"]["channels"]
 
     async def read_component_info_channels(self, components: dict):
         """Read hostname and all component names of an edge."""
 
-        # Look up all components which have a channel "_PropertyAlias"
-        alias_components = []
-        for comp_name, comp in components.items():
-            for chan in comp["channels"]:
-                if chan["id"] == "_PropertyAlias":
-                    alias_components.append(comp_name)
-                    continue
-
+        # Request "_PropertyAlias" of all components which have one, in one subscription
         config_channels = ["_host/Hostname"]
-        config_channels.extend(c + "/_PropertyAlias" for c in alias_components)
+        config_channels.extend(
+            comp_name + "/_PropertyAlias"
+            for comp_name, comp in components.items()
+            if any(chan["id"] == "_PropertyAlias" for chan in comp["channels"])
+        )
         data = await self.get_channel_values_via_websocket(config_channels)
 
         # store component aliases and hostname in the json config of the component
         for address, value in data.items():
-            component, channel = address.split("/")
-            if component in components:
-                components[component][channel] = value
+            component, channel = address.split("/", 1)
+            if (component_config := components.get(component)) is not None:
+                component_config[channel] = value
 
     async def get_channel_values_via_websocket(self, channels: list[str]) -> dict:
-        """Read channels via dedicated websocket connection."""
+        """Read channels once via the existing websocket connection."""
         if not self.edge_id:
-            raise EdgeNotDefinedError(
-                "No edge ID defined for reading components.")
-
-        # create new connection and login
-        rpc_server = jsonrpc_websocket.Server(
-            url=self.connection.conn_url,
-            session=None,
-            heartbeat=5,
-        )
-
-        await rpc_server.ws_connect()
-        _LOGGER.debug("wsocket component info request: login")
-        await rpc_server.authenticateWithPassword(
-            username=self.connection.username, password=self.connection.password
-        )
-
-        # prepare callback event and subscribe for the required data
-        data_received: asyncio.Event = asyncio.Event()
-        data = {}
-
-        def _handle_callback(**kwargs):
-            if kwargs["payload"]["method"] != "currentData":
-                # ignore
-                return
-
-            nonlocal data
-            data = kwargs["payload"]["params"]
-            data_received.set()
-
-        rpc_server.edgeRpc = _handle_callback
-        await rpc_server.subscribeEdges(edges=[self.edge_id])
-
-        subscribe_call = wrap_jsonrpc(
-            "subscribeChannels", count=0, channels=channels)
-        # pyright: ignore[reportGeneralTypeIssues]
-        await rpc_server.edgeRpc(edgeId=self.edge_id, payload=subscribe_call)
+            raise EdgeNotDefinedError("No edge ID defined for reading components.")
+
+        key = frozenset(channels)
+        if (read_task := self._pending_channel_reads.get(key)) is None:
+            read_task = asyncio.create_task(self._read_channel_values(channels))
+            self._pending_channel_reads[key] = read_task
+
+            def _read_done(task: asyncio.Task[dict]) -> None:
+                self._pending_channel_reads.pop(key, None)
+                # retrieve the error here, all waiting callers may have been cancelled
+                if not task.cancelled():
+                    task.exception()
+
+            read_task.add_done_callback(_read_done)
+        # a cancelled caller must not cancel the read of the other callers
+        return await asyncio.shield(read_task)
+
+    async def _read_channel_values(self, channels: list[str]) -> dict:
+        """Subscribe the channels until the first data push and return its values."""
+        connection = self.connection
+        # one read at a time, each read replaces the handler and the subscription
+        async with connection.subscription_lock:
+            rpc_server = connection.rpc_server
+            # add the read channels to the live subscription instead of replacing it
+            live_channels = connection.subscribed_channels
+            requested = frozenset(channels)
+            # pushes sent before the new subscription applies only carry live channels
+            new_channels = (requested - live_channels) or requested
+            previous_handler = connection.edge_rpc_handler
+
+            # prepare a future for the first data push
+            data_future: asyncio.Future[dict] = (
+                asyncio.get_running_loop().create_future()
+            )
 
-        # wait for the data. When received, close connection and return data
-        await asyncio.wait_for(data_received.wait(), timeout=5)
-        await rpc_server.close()
+            def _handle_callback(**kwargs):
+                payload = kwargs["payload"]
+                if (
+                    payload["method"] == "currentData"
+                    and not data_future.done()
+                    and not new_channels.isdisjoint(payload["params"])
+                ):
+                    data_future.set_result(payload["params"])
+                # live updates are still delivered to the previous handler
+                previous_handler(**kwargs)
+
+            connection.set_edge_rpc_handler(_handle_callback)
+            try:
+                if not live_channels:
+                    await rpc_server.subscribeEdges(edges=[self.edge_id])
 
-        return data
+                subscribe_call = wrap_jsonrpc(
+                    "subscribeChannels",
+                    count=connection.next_subscription_count(),
+                    channels=sorted(live_channels | requested),
+                )
+                # pyright: ignore[reportGeneralTypeIssues]
+                await rpc_server.edgeRpc(edgeId=self.edge_id, payload=subscribe_call)
+
+                # wait for the data
+                data = await asyncio.wait_for(data_future, timeout=5)
+            finally:
+                connection.set_edge_rpc_handler(previous_handler)
+                # restore the live subscription, also after a failed read
+                restore_call = wrap_jsonrpc(
+                    "subscribeChannels",
+                    count=connection.next_subscription_count(),
+                    channels=sorted(connection.subscribed_channels),
+                )
+                with contextlib.suppress(
+                    jsonrpc_base.jsonrpc.TransportError,
+                    jsonrpc_base.jsonrpc.ProtocolError,
+                ):
+                    # pyright: ignore[reportGeneralTypeIssues]
+                    await rpc_server.edgeRpc(edgeId=self.edge_id, payload=restore_call)
+
+        # the push also contains the values of the live subscription
+        return {
+            address: value for address, value in data.items() if address in requested
+        }
 
     async def read_edges(self) -> dict:
-        """Request list of all edges."""
+        """Request list of all edges within a single page."""
         return await self.connection.rpc_server.getEdges(
-            page=0, limit=20, searchParams={}
+            page=0, limit=GET_EDGES_LIMIT, searchParams={}
         )
 
     @staticmethod
@@ -22,9 +22,10 @@ def connection_url(type: str, host: str | None = None) -> URL:
 
 def wrap_jsonrpc(method: str, **params):
     """Wrap a method call with paramters into a jsonrpc call."""
-    envelope = {}
-    envelope["jsonrpc"] = "2.0"
-    envelope["method"] = method
-    envelope["params"] = params
-    envelope["id"] = str(uuid.uuid4())
-    return envelope
+    # OpenEMS parses the id as a UUID in its canonical, hyphenated string form
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+        "id": str(uuid.uuid4()),
+    }
@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import IntFlag
+from functools import lru_cache
 import re
 from typing import ClassVar
 
@@ -154,6 +155,7 @@ def find_channel_in_backend(
     return None
 
 
+@lru_cache(maxsize=1024)
 def to_snake_case(name: str) -> str:
     """Convert given name to snake_case."""
     return SNAKE_REPLACE_PATTERN.sub("_", name).lower()
@@ -1,7 +1,9 @@
 """Helper methods using openems classes, eg during channel creation."""
 
+from collections.abc import Mapping
+from functools import lru_cache
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from jinja2 import Template
 
@@ -10,16 +12,35 @@ from .const import SLASH_ESC
 if TYPE_CHECKING:
     from .openems import OpenEMSComponent
 
+TEMPLATE_VAR_PATTERN = re.compile(r"{{(.*?)}}")
+# variables like {n} within a sensor definition, to be expanded by matching channel ids
+DEF_VAR_PATTERN = re.compile(r"\{(\w+)\}")
+# plain arithmetic on numbers and channel references, no filters or calls
+NUMERIC_EXPR_PATTERN = re.compile(r"[\w\s.+\-*/()]+")
+
+
+class NumericExpression:
+    """Arithmetic expression, evaluated without the overhead of a jinja template."""
+
+    def __init__(self, expr: str) -> None:
+        """Compile the expression."""
+        self._code = compile(expr, "<expression>", "eval")
+        # names looked up when evaluating the expression
+        self.names: tuple[str, ...] = self._code.co_names
+
+    def render(self, values: Mapping[str, Any] | None = None) -> Any:
+        """Evaluate the expression with the given channel values."""
+        return eval(self._code, {"__builtins__": {}}, values or {})  # noqa: S307
+
 
 def prepare_ref_value(
     expr: str, component: OpenEMSComponent
-) -> tuple[Template, list[str]]:
+) -> tuple[Template | NumericExpression, list[str]]:
     """Parse a template string into a template and channels contained."""
     linked_channels = []
 
     def calc_component_reference(matchobj) -> str:
-        nonlocal linked_channels
-        match = matchobj.group()[2:-2]
+        match = matchobj.group(1)
         if "/" in match:
             comp_ref, channel = match.split("/")
             if comp_ref[0] == "$":
@@ -36,8 +57,23 @@ def prepare_ref_value(
             linked_channels.append(linked_channel)
         return linked_channel
 
-    value_expr = "{{" + re.sub(r"{{(.*?)}}", calc_component_reference, expr) + "}}"
-    return Template(value_expr), linked_channels
+    value_expr = TEMPLATE_VAR_PATTERN.sub(calc_component_reference, expr)
+    return _compile_expression(value_expr), linked_channels
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(value_expr: str) -> Template | NumericExpression:
+    """Compile an expression once, it is shared by all users of the same expression."""
+    if NUMERIC_EXPR_PATTERN.fullmatch(value_expr) and "__" not in value_expr:
+        try:
+            expression = NumericExpression(value_expr)
+        except SyntaxError:
+            pass
+        else:
+            # jinja renders names other than channel references as empty string
+            if all(SLASH_ESC in name for name in expression.names):
+                return expression
+    return Template("{{" + value_expr + "}}")
 
 
 def expand_sensor_def(
@@ -45,27 +81,26 @@ def expand_sensor_def(
 ) -> list[dict[str, str]]:
     """Expand a sensor definition with variables in the id and template."""
     # find all variables in the sensor template
-    var_pattern = re.compile(r"{{(.*?)}}")
-    refs = var_pattern.findall(sensor_def["template"])
+    refs = TEMPLATE_VAR_PATTERN.findall(sensor_def["template"])
 
     # create corresponding regexps to apply group matches against it afterwards
-    template_variables: list[tuple[str, str]] = []
+    template_variables: list[tuple[str, re.Pattern]] = []
     pattern_matched = False
     for ref in refs:
-        ref_pattern, num_subs = re.subn(r"\{(\w+)\}", r"(?P<\1>[^{}]+)", ref)
+        ref_pattern, num_subs = DEF_VAR_PATTERN.subn(r"(?P<\1>[^{}]+)", ref)
         pattern_matched |= num_subs > 0
-        template_variables.append((ref, ref_pattern))
+        template_variables.append((ref, re.compile(ref_pattern)))
     # if no variables need to be expanded, return the original sensor definition as a single item list
     if not pattern_matched:
         return [sensor_def]
 
-    key_groups: list[str] = re.findall(r"\{(\w+)\}", sensor_def["id"])
+    key_groups: list[str] = DEF_VAR_PATTERN.findall(sensor_def["id"])
 
     # try to match all channel ids to the variables, and find all channels that match the variable pattern
     target_defs: dict[tuple, list[dict[str, str]]] = {}
     for t in template_variables:
         for channel_id in channel_ids:
-            if match := re.fullmatch(t[1], channel_id):
+            if match := t[1].fullmatch(channel_id):
                 keys = [v for k, v in match.groupdict().items() if k in key_groups]
                 key_tuple = tuple(keys)
                 values = {
@@ -100,8 +135,7 @@ def expand_sensor_def(
             expanded_template_vars[template_var] = (
                 "{{" + "}}, {{".join(expanded_template_vars[template_var]) + "}}"
             )
-            expanded_def = re.sub(
-                var_pattern,
+            expanded_def = TEMPLATE_VAR_PATTERN.sub(
                 lambda m, expanded_template_vars=expanded_template_vars: (
                     expanded_template_vars.get(m.group(1), m.group(0))
                 ),
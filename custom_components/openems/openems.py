@@ -2,7 +2,9 @@
 
 from abc import abstractmethod
 import asyncio
+from bisect import bisect_left
 from collections.abc import Callable
+import contextlib
 from datetime import time
 import logging
 import math
@@ -13,7 +15,7 @@ from jinja2 import Template
 import jsonrpc_base
 from yarl import URL
 
-from .config import OpenEMSConfig
+from .config import OpenEMSConfig, get_config
 from .const import (
     CONF_ADVANCED_OPTIONS,
     CONF_COMPONENTS,
@@ -22,15 +24,19 @@ from .const import (
     CONN_TYPE_WEB_FENECON,
     CONN_TYPES,
     SLASH_ESC,
+    UNAVAILABLE_GRACE_PERIOD_SECONDS,
     AdvancedOptions,
     ConfigOptions,
 )
 from .entry_data import OpenEMSWebSocketConnection
 from .helpers import connection_url, wrap_jsonrpc
-from .helpers_openems import expand_sensor_def, prepare_ref_value
+from .helpers_openems import NumericExpression, expand_sensor_def, prepare_ref_value
 
 _LOGGER = logging.getLogger(__name__)
 
+# number config definitions without references are stored as their constant value
+type ConfigDefinition = Template | NumericExpression | float
+
 
 class RestDetails(NamedTuple):
     """Details about the REST connection."""
@@ -39,23 +45,41 @@ class RestDetails(NamedTuple):
     url: URL
 
 
-CONFIG: OpenEMSConfig = OpenEMSConfig()
+CONFIG: OpenEMSConfig = get_config()
 
 
 class OpenEMSDataHandler:
     """Interface for handling data updates from the backend."""
 
+    # one instance per channel, keep them small
+    __slots__ = (
+        "_current_value",
+        "_unique_id",
+        "address",
+        "callback",
+        "component",
+        "name",
+    )
+
     def __init__(self, component: OpenEMSComponent, name: str) -> None:
         """Initialize the handler."""
         self.component: OpenEMSComponent = component
         self.name: str = name
+        # the channel address used by the edge for subscriptions and updates
+        self.address: str = component.name + "/" + name
         self.callback: Callable | None = None
         self._current_value: Any = None
+        self._unique_id: str | None = None
 
     @abstractmethod
     def handle_data_update(self, channel_name, value: str | float | None) -> None:
         """Handle a data update from the backend."""
 
+    def handle_batch_update(self, updates: dict[str, str | float | None]) -> None:
+        """Handle all data updates of one backend message."""
+        for channel_name, value in updates.items():
+            self.handle_data_update(channel_name, value)
+
     @abstractmethod
     def register_callback(self, callback: Callable):
         """Register callback."""
@@ -75,20 +99,19 @@ class OpenEMSDataHandler:
 
     def unique_id(self) -> str:
         """Generate unique ID for the channel."""
-        return (
-            self.component.edge.hostname
-            + "/"
-            + self.component.edge.id
-            + "/"
-            + self.component.name
-            + "/"
-            + self.name
-        )
+        if self._unique_id is None:
+            edge = self.component.edge
+            self._unique_id = (
+                f"{edge.hostname}/{edge.id}/{self.component.name}/{self.name}"
+            )
+        return self._unique_id
 
 
 class OpenEMSChannel(OpenEMSDataHandler):
     """Class representing a sensor of an OpenEMS component."""
 
+    __slots__ = ("_rest_update_task", "options", "orig_json", "unit")
+
     # Use with platform sensor
     def __init__(
         self,
@@ -100,12 +123,8 @@ class OpenEMSChannel(OpenEMSDataHandler):
         super().__init__(component, channel_json["id"])
         unit = channel_json["unit"]
         self.options: dict[int, str] | None = None
-        if (
-            "category" in channel_json
-            and channel_json["category"] == "ENUM"
-            and options is not None
-        ):
-            self.options = {v: k for k, v in options.items()}
+        if options is not None and channel_json.get("category") == "ENUM":
+            self.options = dict(zip(options.values(), options, strict=True))
 
         self.unit: str = unit
         self.orig_json: dict[str, Any] = channel_json
@@ -143,16 +162,20 @@ class OpenEMSChannel(OpenEMSDataHandler):
     def register_callback(self, callback: Callable):
         """Register callback."""
         self.callback = callback
-        channel_names = {self.component.name + "/" + self.name}
+        channel_names = {self.address}
         self.component.edge.register_channel(channel_names, self)
 
     def unregister_callback(self):
         """Remove callback."""
         self.callback = None
+        self.cancel_rest_update()
+        self.component.edge.unregister_channel(self)
+
+    def cancel_rest_update(self):
+        """Stop a running cyclic REST update."""
         if self._rest_update_task is not None:
             self._rest_update_task.cancel()
             self._rest_update_task = None
-        self.component.edge.unregister_channel(self)
 
     async def update_value(
         self, new_value: float | bool, update_cycle: int, timeout: int
@@ -171,11 +194,10 @@ class OpenEMSChannel(OpenEMSDataHandler):
             return
 
         # clean up a previously running cyclic update task
-        if self._rest_update_task is not None:
-            self._rest_update_task.cancel()
-            self._rest_update_task = None
+        self.cancel_rest_update()
 
-        # prepare REST URL and data
+        # prepare REST session, URL and data
+        session = backend.rest_session
         url = edge.rest.url.joinpath("channel", self.component.name, self.name)
         data = {"value": new_value}
 
@@ -187,14 +209,8 @@ class OpenEMSChannel(OpenEMSDataHandler):
 
         async def _rest_update_oneshot():
             """Send REST update command."""
-            auth = aiohttp.BasicAuth(
-                backend.connection.username, backend.connection.password
-            )
             try:
-                async with (
-                    aiohttp.ClientSession(raise_for_status=False, auth=auth) as session,
-                    session.post(url, json=data) as resp,
-                ):
+                async with session.post(url, json=data) as resp:
                     if resp.status != 200:
                         _LOGGER.error(
                             "Error during REST call to update channel %s/%s: HTTP %d: %s",
@@ -237,12 +253,14 @@ class OpenEMSChannel(OpenEMSDataHandler):
 class OpenEMSDerivedChannel(OpenEMSDataHandler):
     """Class representing a derived sensor of an OpenEMS component."""
 
+    __slots__ = ("reference_channels", "sensor_template", "unit")
+
     def __init__(
         self, component: OpenEMSComponent, combined_sensor_def: dict[str, Any]
     ) -> None:
         """Initialize the derived channel."""
         super().__init__(component, combined_sensor_def["id"])
-        self.sensor_template: Template
+        self.sensor_template: Template | NumericExpression
         self.unit: str = combined_sensor_def["unit_of_measurement"]
         self.reference_channels: dict[str, str | float | None] = {}
         self.sensor_template, sensor_references = prepare_ref_value(
@@ -254,7 +272,7 @@ class OpenEMSDerivedChannel(OpenEMSDataHandler):
         """Register callback."""
         self.callback = callback
         channel_names = {x.replace(SLASH_ESC, "/") for x in self.reference_channels} | {
-            self.component.name + "/" + self.name,
+            self.address,
         }
         self.component.edge.register_channel(channel_names, self)
 
@@ -265,21 +283,31 @@ class OpenEMSDerivedChannel(OpenEMSDataHandler):
 
     def handle_data_update(self, channel_name, value: str | float | None) -> None:
         """Handle a data update from the backend."""
-        channel_reference = channel_name.replace("/", SLASH_ESC)
-        if channel_reference in self.reference_channels:
-            if self.reference_channels[channel_reference] != value:
+        self.handle_batch_update({channel_name: value})
+
+    def handle_batch_update(self, updates: dict[str, str | float | None]) -> None:
+        """Handle all data updates of one backend message with a single render."""
+        changed = False
+        for channel_name, value in updates.items():
+            channel_reference = channel_name.replace("/", SLASH_ESC)
+            if (
+                channel_reference in self.reference_channels
+                and self.reference_channels[channel_reference] != value
+            ):
                 self.reference_channels[channel_reference] = value
+                changed = True
+        if not changed:
+            return
 
-                try:
-                    render_result = self.sensor_template.render(self.reference_channels)
-                    channel_value = float(render_result)
-                except ValueError, TypeError:
-                    channel_value = None
+        try:
+            render_result = self.sensor_template.render(self.reference_channels)
+            channel_value = float(render_result)
+        except ValueError, TypeError:
+            channel_value = None
 
-                if channel_value != self._current_value:
-                    self._current_value = channel_value
-                    self.notify_ha()
-            return
+        if channel_value != self._current_value:
+            self._current_value = channel_value
+            self.notify_ha()
 
     @property
     def native_value(self) -> float | None:
@@ -293,6 +321,8 @@ class OpenEMSDerivedChannel(OpenEMSDataHandler):
 class OpenEMSProperty(OpenEMSChannel):
     """Class representing a property of an OpenEMS component."""
 
+    __slots__ = ()
+
     async def update_value(self, new_value: Any) -> None:
         """Handle value change request from Home Assisant."""
         channel_names, condition_value = CONFIG.update_group_members(
@@ -301,11 +331,7 @@ class OpenEMSProperty(OpenEMSChannel):
         properties = [(self.name[9].lower() + self.name[10:], new_value)]
         if condition_value is None or condition_value == new_value:
             for channel_name in channel_names:
-                channel: OpenEMSProperty = next(
-                    chan
-                    for chan in self.component.properties
-                    if chan.name == channel_name
-                )
+                channel = self.component.properties_by_name[channel_name]
                 properties.append(
                     (channel.name[9].lower() + channel.name[10:], channel.current_value)
                 )
@@ -316,6 +342,8 @@ class OpenEMSProperty(OpenEMSChannel):
 class OpenEMSEnumProperty(OpenEMSProperty):
     """Class representing a enum property of an OpenEMS component."""
 
+    __slots__ = ("property_options",)
+
     # Use with platform select
     def __init__(
         self, component: OpenEMSComponent, channel_json: dict, options: list[str]
@@ -354,6 +382,8 @@ class OpenEMSEnumProperty(OpenEMSProperty):
 class OpenEMSTimeProperty(OpenEMSProperty):
     """Class representing a time property of an OpenEMS component."""
 
+    __slots__ = ()
+
     # Use with platform time
     def handle_data_update(self, channel_name, value: str | float | None):
         """Handle a data update from the backend."""
@@ -384,7 +414,19 @@ class OpenEMSTimeProperty(OpenEMSProperty):
 class OpenEMSNumberProperty(OpenEMSProperty):
     """Class representing a number property of an OpenEMS component."""
 
+    __slots__ = (
+        "lower_limit",
+        "lower_limit_def",
+        "multiplier",
+        "multiplier_def",
+        "reference_channels",
+        "step",
+        "upper_limit",
+        "upper_limit_def",
+    )
+
     STEPS = 200  # Minimum number of steps
+    POWERS_OF_10 = tuple(10**k for k in range(16))  # Candidates for the step size
 
     # Use with platform Number
     def __init__(
@@ -398,9 +440,9 @@ class OpenEMSNumberProperty(OpenEMSProperty):
         self.lower_limit: float = 0
         self.upper_limit: float = 100000
 
-        self.multiplier_def: Template = Template(str(self.multiplier))
-        self.lower_limit_def: Template = Template(str(self.lower_limit))
-        self.upper_limit_def: Template = Template(str(self.upper_limit))
+        self.multiplier_def: ConfigDefinition = float(self.multiplier)
+        self.lower_limit_def: ConfigDefinition = float(self.lower_limit)
+        self.upper_limit_def: ConfigDefinition = float(self.upper_limit)
 
         self.step: float = 1.0
         self.reference_channels: dict[str, str | float | None] = {}
@@ -415,15 +457,38 @@ class OpenEMSNumberProperty(OpenEMSProperty):
 
     def handle_data_update(self, channel_name, value: str | float | None):
         """Handle a data update from the backend."""
-        channel_reference = channel_name.replace("/", SLASH_ESC)
-        if channel_reference in self.reference_channels:
-            if self.reference_channels[channel_reference] != value:
+        if channel_name == self.address:
+            self._handle_own_value(value)
+        else:
+            self.handle_batch_update({channel_name: value})
+
+    def handle_batch_update(self, updates: dict[str, str | float | None]) -> None:
+        """Handle all data updates of one backend message.
+
+        Reference updates are applied first, so the config is calculated only once.
+        """
+        own_values = []
+        references_changed = False
+        for channel_name, value in updates.items():
+            if channel_name == self.address:
+                own_values.append(value)
+                continue
+            channel_reference = channel_name.replace("/", SLASH_ESC)
+            if channel_reference not in self.reference_channels:
+                own_values.append(value)
+            elif self.reference_channels[channel_reference] != value:
                 self.reference_channels[channel_reference] = value
-                if self._update_config():
-                    # config vars changed. Update the entity in HA
-                    self.notify_ha()
-            return
+                references_changed = True
+
+        if references_changed and self._update_config():
+            # config vars changed. Update the entity in HA
+            self.notify_ha()
+
+        for value in own_values:
+            self._handle_own_value(value)
 
+    def _handle_own_value(self, value: str | float | None) -> None:
+        """Scale and apply a value update of the property itself."""
         if isinstance(value, (float, int)):
             new_val = self.multiplier * value
         else:
@@ -439,22 +504,18 @@ class OpenEMSNumberProperty(OpenEMSProperty):
         lower_limit = self.lower_limit
         upper_limit = self.upper_limit
         step = self.step
-        if self.multiplier_def:
-            try:
-                render_result = self.multiplier_def.render(self.reference_channels)
-                multiplier = float(render_result)
-            except ValueError, TypeError:
-                multiplier = 1.0
+        try:
+            multiplier = self._evaluate(self.multiplier_def)
+        except ValueError, TypeError:
+            multiplier = 1.0
 
         try:
-            render_result = self.lower_limit_def.render(self.reference_channels)
-            lower_noscale = float(render_result)
+            lower_noscale = self._evaluate(self.lower_limit_def)
         except ValueError, TypeError:
             lower_noscale = None
 
         try:
-            render_result = self.upper_limit_def.render(self.reference_channels)
-            upper_noscale = float(render_result)
+            upper_noscale = self._evaluate(self.upper_limit_def)
         except ValueError, TypeError:
             upper_noscale = None
 
@@ -476,8 +537,12 @@ class OpenEMSNumberProperty(OpenEMSProperty):
             min_step_range = max(
                 1, (upper_scaled - lower_scaled) / OpenEMSNumberProperty.STEPS
             )
-            # align step size with a power of 10
-            step = 10 ** math.ceil(math.log10(min_step_range))
+            # align step size with the next power of 10
+            powers = OpenEMSNumberProperty.POWERS_OF_10
+            if (exp := bisect_left(powers, min_step_range)) < len(powers):
+                step = powers[exp]
+            else:
+                step = 10 ** math.ceil(math.log10(min_step_range))
             lower_limit = math.ceil(float(lower_scaled) / step) * step
             upper_limit = math.ceil(float(upper_scaled) / step) * step
 
@@ -500,52 +565,52 @@ class OpenEMSNumberProperty(OpenEMSProperty):
 
         return False
 
+    def _evaluate(self, definition: ConfigDefinition) -> float:
+        """Evaluate a config definition against the current reference values."""
+        if isinstance(definition, float):
+            return definition
+        return float(definition.render(self.reference_channels))
+
+    def _prepare_def(self, expr: str) -> ConfigDefinition:
+        """Parse a config definition and register its references."""
+        template, references = prepare_ref_value(expr, self.component)
+        if not references:
+            # no external references. Calculate the result immediately
+            return float(template.render())
+        for ref in references:
+            self.reference_channels[ref] = None
+        return template
+
     async def update_value(self, new_value: float) -> None:
         """Handle value change request from Home Assisant."""
         await super().update_value(new_value / self.multiplier)
 
     def set_multiplier_def(self, multiplier_def):
         """Initialize the multiplier of the number channel."""
-        self.multiplier_def, multiplier_references = prepare_ref_value(
-            multiplier_def, self.component
-        )
-        if not multiplier_references:
-            # no external references. Calculate the result immediately
-            self.multiplier = float(self.multiplier_def.render())
-        else:
-            for ref in multiplier_references:
-                self.reference_channels[ref] = None
+        self.multiplier_def = self._prepare_def(multiplier_def)
+        if isinstance(self.multiplier_def, float):
+            self.multiplier = self.multiplier_def
 
     def set_limit_def(self, limit_def):
         """Initialize the limits of the number channel."""
-        self.lower_limit_def, lower_references = prepare_ref_value(
-            limit_def["lower"], self.component
-        )
-        if not lower_references:
-            # no external references. Calculate the result immediately
-            self.lower_limit = float(self.lower_limit_def.render())
-        else:
-            for ref in lower_references:
-                self.reference_channels[ref] = None
+        self.lower_limit_def = self._prepare_def(limit_def["lower"])
+        if isinstance(self.lower_limit_def, float):
+            self.lower_limit = self.lower_limit_def
 
-        self.upper_limit_def, upper_references = prepare_ref_value(
-            limit_def["upper"], self.component
-        )
-        if not upper_references:
-            # no external references. Calculate the result immediately
-            self.upper_limit = float(self.upper_limit_def.render())
-        else:
-            for ref in upper_references:
-                self.reference_channels[ref] = None
+        self.upper_limit_def = self._prepare_def(limit_def["upper"])
+        if isinstance(self.upper_limit_def, float):
+            self.upper_limit = self.upper_limit_def
 
-        if not (lower_references or upper_references):
+        if isinstance(self.lower_limit_def, float) and isinstance(
+            self.upper_limit_def, float
+        ):
             self._update_config()
 
     def register_callback(self, callback: Callable):
         """Register callback."""
         self.callback = callback
         channel_names = {x.replace(SLASH_ESC, "/") for x in self.reference_channels} | {
-            self.component.name + "/" + self.name,
+            self.address,
         }
         self.component.edge.register_channel(channel_names, self)
 
@@ -553,6 +618,8 @@ class OpenEMSNumberProperty(OpenEMSProperty):
 class OpenEMSBooleanProperty(OpenEMSProperty):
     """Class representing a boolean property of an OpenEMS component."""
 
+    __slots__ = ()
+
     # Use with platform switch
 
     @property
@@ -586,6 +653,10 @@ class OpenEMSComponent:
         self.boolean_properties: list[OpenEMSBooleanProperty] = []
         self.time_properties: list[OpenEMSTimeProperty] = []
         self.derived_sensors: list[OpenEMSDerivedChannel] = []
+        # aggregated views on the lists above, updated by init_channels
+        self._properties: tuple[OpenEMSProperty, ...] = ()
+        self._channels: tuple[OpenEMSDataHandler, ...] = ()
+        self.properties_by_name: dict[str, OpenEMSProperty] = {}
         self.create_entities: bool = False
 
     def init_channels(self, channels: list[dict[str, Any]]):
@@ -594,9 +665,13 @@ class OpenEMSComponent:
             options_backend: dict[str, int] | list[str] | None = channel_json.pop(
                 "options", None
             )
-            if channel_json["id"].startswith("_Property"):
+            channel_id: str = channel_json["id"]
+            channel_type: str = channel_json["type"]
+            if channel_id.startswith("_Property"):
+                # one config lookup for all property types
+                prop_config = CONFIG.resolve(self.name, channel_id)
                 # scan type and convert to property
-                match channel_json["type"]:
+                match channel_type:
                     case "BOOLEAN":
                         prop = OpenEMSBooleanProperty(
                             component=self, channel_json=channel_json
@@ -607,7 +682,7 @@ class OpenEMSComponent:
                             # options received from backend are preferred over configured options
                             options_backend
                             if isinstance(options_backend, list)
-                            else CONFIG.get_enum_options(self.name, channel_json["id"])
+                            else prop_config.options
                         )
                         if options is not None:
                             prop = OpenEMSEnumProperty(
@@ -616,19 +691,15 @@ class OpenEMSComponent:
                                 options=options,
                             )
                             self.enum_properties.append(prop)
-                        elif CONFIG.is_time_property(self.name, channel_json["id"]):
+                        elif prop_config.is_time:
                             prop = OpenEMSTimeProperty(
                                 component=self, channel_json=channel_json
                             )
                             self.time_properties.append(prop)
                     case "INTEGER":
-                        if limit_def := CONFIG.get_number_limit(
-                            self.name, channel_json["id"]
-                        ):
+                        if limit_def := prop_config.limit:
                             try:
-                                multiplier = CONFIG.get_number_multiplier(
-                                    self.name, channel_json["id"]
-                                )
+                                multiplier = prop_config.multiplier
                                 prop = OpenEMSNumberProperty(
                                     component=self, channel_json=channel_json
                                 )
@@ -645,7 +716,7 @@ class OpenEMSComponent:
                                 _LOGGER.warning(
                                     "Error during initialization of channel %s/%s",
                                     self.name,
-                                    channel_json["id"],
+                                    channel_id,
                                     exc_info=True,
                                 )
 
@@ -654,11 +725,19 @@ class OpenEMSComponent:
                 channel = OpenEMSChannel(
                     component=self, channel_json=channel_json, options=options
                 )
-                match channel_json["type"]:
+                match channel_type:
                     case "BOOLEAN":
                         self.boolean_sensors.append(channel)
                     case _:
                         self.sensors.append(channel)
+        self._properties = (
+            *self.enum_properties,
+            *self.number_properties,
+            *self.boolean_properties,
+            *self.time_properties,
+        )
+        self._channels = (*self._properties, *self.sensors, *self.boolean_sensors)
+        self.properties_by_name = {prop.name: prop for prop in self._properties}
         # prepare derived sensors.
         for sensor_def in CONFIG.get_combined_sensors(self.name):
             # 1st step: map variables in config ids to concrete names
@@ -678,7 +757,7 @@ class OpenEMSComponent:
             _LOGGER.error(
                 'No connection to backend. Cannot send "updateComponentConfig" message for component %s with properties: %s',
                 self.name,
-                str(properties),
+                properties,
             )
             return
 
@@ -688,30 +767,21 @@ class OpenEMSComponent:
         _LOGGER.debug(
             "updateComponentConfig: component: %s, properties: %s",
             self.name,
-            str(properties),
+            properties,
         )
         await self.edge.backend.connection.rpc_server.edgeRpc(
             edgeId=self.edge.id, payload=envelope
         )
 
     @property
-    def channels(self) -> list[OpenEMSDataHandler]:
+    def channels(self) -> tuple[OpenEMSDataHandler, ...]:
         """Return all channels of the component (all platforms)."""
-        return [
-            *self.properties,
-            *self.sensors,
-            *self.boolean_sensors,
-        ]
+        return self._channels
 
     @property
-    def properties(self) -> list[OpenEMSProperty]:
+    def properties(self) -> tuple[OpenEMSProperty, ...]:
         """Return all properties of the component (all platforms)."""
-        return [
-            *self.enum_properties,
-            *self.number_properties,
-            *self.boolean_properties,
-            *self.time_properties,
-        ]
+        return self._properties
 
 
 class OpenEMSEdge:
@@ -720,53 +790,73 @@ class OpenEMSEdge:
     class OpenEmsEdgeChannelSubscriptionUpdater:
         """Allows to register callbacks methods and get notified on updates."""
 
+        RETRY_INTERVAL = 5  # Seconds until a failed subscription is retried
+        DEBOUNCE_INTERVAL = 0.1  # Seconds to collect further changes before subscribing
+
         def __init__(self, edge) -> None:
             """Initialize the updater."""
             self._edge: OpenEMSEdge = edge
-            loop = asyncio.get_event_loop()
-            self._fetch_task = loop.create_task(self._update_subscriptions_forever())
-            self._active_subscriptions = []
-            self._count = 0
+            self._dirty = asyncio.Event()
+            self._fetch_task = edge.loop.create_task(
+                self._update_subscriptions_forever()
+            )
 
         def stop(self):
             """Stop the updater."""
             self._fetch_task.cancel()
 
         def clear(self):
-            """Clear the list of active subscriptions."""
-            self._active_subscriptions = []
+            """Clear the set of active subscriptions."""
+            self._edge.backend.connection.subscribed_channels = frozenset()
+            self._dirty.set()
+
+        def notify_changed(self):
+            """Trigger a subscription update after the registered channels changed."""
+            self._dirty.set()
+
+        async def _subscribe(self, channels: frozenset[str]):
+            """Replace the channel subscription of the edge."""
+            connection = self._edge.backend.connection
+            # one-shot channel reads change the subscription as well
+            async with connection.subscription_lock:
+                if not connection.subscribed_channels:
+                    # no active subscription, so subscribe for the edge
+                    await connection.rpc_server.subscribeEdges(edges=[self._edge.id])
+
+                # the count is shared with other subscriptions of the connection
+                subscribe_call = wrap_jsonrpc(
+                    "subscribeChannels",
+                    count=connection.next_subscription_count(),
+                    channels=sorted(channels),
+                )
+                await connection.rpc_server.edgeRpc(
+                    edgeId=self._edge.id, payload=subscribe_call
+                )
+                connection.subscribed_channels = channels
 
         async def _update_subscriptions_forever(self):
+            connection = self._edge.backend.connection
             try:
                 _LOGGER.debug("SubscriptionUpdater start")
+                # wait for changes, only poll while a subscription is pending
+                timeout = None
                 while True:
-                    await asyncio.sleep(5)
-                    subscribe_in_progress_channels = list(
-                        self._edge.registered_channels.keys()
-                    )
-                    if (
-                        self._edge.backend.connection.rpc_server.connected
-                        and subscribe_in_progress_channels != self._active_subscriptions
-                    ):
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._dirty.wait(), timeout)
+                    if self._dirty.is_set():
+                        # entities are added in bursts, send one request for all of them
+                        await asyncio.sleep(self.DEBOUNCE_INTERVAL)
+                    self._dirty.clear()
+                    # compare the keys view directly, copy it only after a change
+                    registered = self._edge.registered_channels.keys()
+                    if registered == connection.subscribed_channels:
+                        timeout = None
+                        continue
+                    subscribe_in_progress_channels = frozenset(registered)
+                    timeout = self.RETRY_INTERVAL
+                    if connection.rpc_server.connected:
                         try:
-                            if not self._active_subscriptions:
-                                # no active subscription, so subscribe for the edge
-                                await self._edge.backend.connection.rpc_server.subscribeEdges(
-                                    edges=[self._edge.id]
-                                )
-                                self._count = 0
-                            else:
-                                self._count += 1
-
-                            subscribe_call = wrap_jsonrpc(
-                                "subscribeChannels",
-                                count=self._count,
-                                channels=subscribe_in_progress_channels,
-                            )
-                            await self._edge.backend.connection.rpc_server.edgeRpc(
-                                edgeId=self._edge.id, payload=subscribe_call
-                            )
-                            self._active_subscriptions = subscribe_in_progress_channels
+                            await self._subscribe(subscribe_in_progress_channels)
                             _LOGGER.debug(
                                 "SubscriptionUpdater update: %d entities",
                                 len(subscribe_in_progress_channels),
@@ -788,16 +878,23 @@ class OpenEMSEdge:
         """Initialize the edge."""
         self.backend: OpenEMSBackend = backend
         self._id: str = id
+        # the edge is created within the running event loop of Home Assistant
+        self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
         self._advanced_options: AdvancedOptions = AdvancedOptions(
             ignore_decreasing_if_total_increasing=False,
             forward_interval=0,
         )
         self._channel_data_forwarder: asyncio.Task | None = None
+        self._unavailable_timer: asyncio.TimerHandle | None = None
         self.current_channel_data: dict[str, Any] = {}
         self._channel_subscription_updater = self.OpenEmsEdgeChannelSubscriptionUpdater(
             self
         )
-        self._registered_handlers: dict[str, set[OpenEMSDataHandler]] = {}
+        # handler tuples are replaced instead of modified, so they can be iterated safely
+        self._registered_handlers: dict[str, tuple[OpenEMSDataHandler, ...]] = {}
+        # reverse index of _registered_handlers, to unregister a handler quickly
+        self._handler_channels: dict[OpenEMSDataHandler, set[str]] = {}
+        self._unsubscribed_channels: set[str] = set()
         self.hostname: str = component_config["_host"]["Hostname"]
         if self.backend.multi_edge:
             self.hostname += " " + self.id
@@ -841,16 +938,45 @@ class OpenEMSEdge:
         return None
 
     def set_unavailable(self):
-        """Set all active entities to unavailable and clear the subscription indicator."""
+        """Set all active entities to unavailable."""
+        self._cancel_unavailable_timer()
+        self._forward_current_channel_data(dict.fromkeys(self.current_channel_data))
+
+    def connection_lost(self):
+        """Keep the last values for a grace period before setting entities unavailable."""
         # Note: This method is called by the connection logic on connection loss.
-        for channel_name in self.current_channel_data:
-            for handler in self._registered_handlers[channel_name]:
-                handler.handle_data_update(channel_name, None)
+        # The subscriptions are gone with the connection, so they need to be renewed.
         self._channel_subscription_updater.clear()
+        if self._unavailable_timer is not None:
+            return
+        # the loss may be detected late, the grace period starts with the last data
+        delay = (
+            UNAVAILABLE_GRACE_PERIOD_SECONDS
+            - self.backend.connection.seconds_since_data_received()
+        )
+        if delay > 0:
+            self._unavailable_timer = self.loop.call_later(delay, self.set_unavailable)
+        else:
+            self.set_unavailable()
+
+    def connection_restored(self):
+        """Keep the last values, the renewed subscriptions deliver new data."""
+        # Note: This method is called by the connection logic after a reconnect.
+        self._cancel_unavailable_timer()
+
+    def _cancel_unavailable_timer(self):
+        if self._unavailable_timer is not None:
+            self._unavailable_timer.cancel()
+            self._unavailable_timer = None
 
     def stop(self):
         """Stop the connection to edge and all its subscriptions."""
+        self._cancel_unavailable_timer()
         self._channel_subscription_updater.stop()
+        # cyclic REST updates must end before the backend closes the REST session
+        for component in self.components.values():
+            for channel in (*component.sensors, *component.boolean_sensors):
+                channel.cancel_rest_update()
         if self._channel_data_forwarder is not None:
             self._channel_data_forwarder.cancel()
             self._channel_data_forwarder = None
@@ -862,15 +988,25 @@ class OpenEMSEdge:
 
     def _forward_current_channel_data(self, params: dict[str, str | float | None]):
         """Forward channel data to registered handlers."""
+        # collect the updates per handler, so each handler processes them at once
+        handler_updates: dict[OpenEMSDataHandler, dict[str, str | float | None]] = {}
+        get_handlers = self._registered_handlers.get
         for channel_name, value in params.items():
-            registered_handlers = self._registered_handlers.get(channel_name)
+            registered_handlers = get_handlers(channel_name)
             if not registered_handlers:
-                _LOGGER.debug(
-                    "Received data update for unsubscribed channel: %s", channel_name
-                )
+                # log only once per channel, such updates are repeated on every push
+                if channel_name not in self._unsubscribed_channels:
+                    self._unsubscribed_channels.add(channel_name)
+                    _LOGGER.debug(
+                        "Received data update for unsubscribed channel: %s",
+                        channel_name,
+                    )
                 continue
             for handler in registered_handlers:
-                handler.handle_data_update(channel_name, value)
+                handler_updates.setdefault(handler, {})[channel_name] = value
+
+        for handler, updates in handler_updates.items():
+            handler.handle_batch_update(updates)
 
     async def _forwarder_channel_data_forever(self, interval: int):
         """Periodically forward the latest channel data snapshot to registered handlers."""
@@ -881,6 +1017,8 @@ class OpenEMSEdge:
     def currentData(self, params: dict[str, str | float | None]):
         """Jsonrpc callback to receive channel subscription updates."""
         self.backend.connection.notify_data_received()
+        # the connection is back before the grace period ended
+        self._cancel_unavailable_timer()
         self.current_channel_data = params
 
         # forward data only when there is no forwarder, meaning no forward interval is set.
@@ -889,19 +1027,29 @@ class OpenEMSEdge:
 
     def register_channel(self, channel_names: set[str], handler: OpenEMSDataHandler):
         """Register a channel and its dependent channels for updates."""
+        subscribed = self._handler_channels.setdefault(handler, set())
+        if subscribed.issuperset(channel_names):
+            # already registered, the subscriptions are unaffected
+            return
         for channel_name in channel_names:
-            if channel_name not in self._registered_handlers:
-                self._registered_handlers[channel_name] = {handler}
-            else:
-                self._registered_handlers[channel_name].add(handler)
+            handlers = self._registered_handlers.get(channel_name, ())
+            if handler not in handlers:
+                self._registered_handlers[channel_name] = (*handlers, handler)
+        subscribed.update(channel_names)
+        self._channel_subscription_updater.notify_changed()
 
     def unregister_channel(self, handler: OpenEMSDataHandler):
         """Remove a channel from receiving updates."""
-        for channel_name, handlers in list(self._registered_handlers.items()):
-            if handler in handlers:
-                handlers.remove(handler)
-                if not handlers:
-                    del self._registered_handlers[channel_name]
+        if (channel_names := self._handler_channels.pop(handler, None)) is None:
+            # nothing registered, the subscriptions are unaffected
+            return
+        for channel_name in channel_names:
+            handlers = self._registered_handlers.get(channel_name, ())
+            if remaining := tuple(h for h in handlers if h is not handler):
+                self._registered_handlers[channel_name] = remaining
+            else:
+                self._registered_handlers.pop(channel_name, None)
+        self._channel_subscription_updater.notify_changed()
 
     @property
     def id(self):
@@ -955,7 +1103,7 @@ class OpenEMSEdge:
                 self._channel_data_forwarder.cancel()
                 self._channel_data_forwarder = None
             if new_interval:
-                self._channel_data_forwarder = asyncio.get_event_loop().create_task(
+                self._channel_data_forwarder = self.loop.create_task(
                     self._forwarder_channel_data_forever(new_interval)
                 )
         self._advanced_options = advanced_options
@@ -975,32 +1123,60 @@ class OpenEMSBackend:
         self.connection = connection
         self.multi_edge = multi_edge
 
-        connection.rpc_server.edgeRpc = self.edgeRpc
+        connection.set_edge_rpc_handler(self.edgeRpc)
         self.the_edge = OpenEMSEdge(self, edge_id, components)
+        # edge methods which handle jsonrpc callbacks, by method name
+        self._edge_dispatch: dict[str, Callable[[dict], None]] = {
+            "currentData": self.the_edge.currentData,
+            "edgeConfig": self.the_edge.edgeConfig,
+        }
+        # unknown methods and edges are logged only once, they may be sent repeatedly
+        self._unhandled_methods: set[str] = set()
+        self._unhandled_edges: set[str] = set()
+        self._rest_session: aiohttp.ClientSession | None = None
+
+    @property
+    def rest_session(self) -> aiohttp.ClientSession:
+        """Return the session for REST requests, shared by all channels of the backend."""
+        if self._rest_session is None or self._rest_session.closed:
+            self._rest_session = aiohttp.ClientSession(
+                raise_for_status=False,
+                auth=aiohttp.BasicAuth(
+                    self.connection.username, self.connection.password
+                ),
+            )
+        return self._rest_session
 
     def edgeRpc(self, **kwargs):
         """Handle an edge jsonrpc callback and call the respective method of the edge object."""
-        if kwargs["edgeId"] != self.the_edge.id:
-            _LOGGER.error("Received response for undefined edge: %s", kwargs["edgeId"])
+        if (edge_id := kwargs["edgeId"]) != self.the_edge.id:
+            if edge_id not in self._unhandled_edges:
+                self._unhandled_edges.add(edge_id)
+                _LOGGER.error("Received response for undefined edge: %s", edge_id)
             return
 
-        method_name = kwargs["payload"]["method"]
-        try:
-            method = getattr(self.the_edge, method_name)
-        except AttributeError:
-            _LOGGER.error("Unhandled callback method: %s", method_name)
+        payload = kwargs["payload"]
+        method_name = payload["method"]
+        if (method := self._edge_dispatch.get(method_name)) is None:
+            if method_name not in self._unhandled_methods:
+                self._unhandled_methods.add(method_name)
+                _LOGGER.error("Unhandled callback method: %s", method_name)
             return
 
-        params = kwargs["payload"]["params"]
         # call the edge method
-        method(params)
+        method(payload["params"])
 
     def start(self):
         """Start to subscribe for updates to the edge."""
-        self.connection.enable_reconnect(self.the_edge.set_unavailable)
+        self.connection.enable_reconnect(
+            self.the_edge.connection_lost, self.the_edge.connection_restored
+        )
 
     async def stop(self):
         """Close the connection to the backend and all internal connection objects."""
         await self.connection.stop()
         if self.the_edge:
             self.the_edge.stop()
+        if self._rest_session is not None:
+            await self._rest_session.close()
+            self._rest_session = None
@@ -140,6 +140,28 @@ async def test_form_cannot_connect(
     assert len(mock_setup_entry.mock_calls) == 1
 
 
+async def test_form_cannot_connect_single_arg_error(hass: HomeAssistant) -> None:
+    """Test a TransportError carrying only a message is shown as is."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    error_conn = make_mock_connection()
+    error_conn.connect_to_server = AsyncMock(
+        side_effect=jsonrpc_base.TransportError("Connection already open.")
+    )
+    with patch(
+        "custom_components.openems.config_flow.OpenEMSWebSocketConnection",
+        return_value=error_conn,
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], _USER_INPUT
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"][CONF_HOST] == "Connection already open."
+
+
 _USER_INPUT_CUSTOM_URL = {
     CONF_USERNAME: "user",
     CONF_PASSWORD: "password",
@@ -362,7 +362,7 @@ def test_tower_cell_voltage_difference_partial_update_stays_none() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_derived_sensors_created_via_init_channels() -> None:
+async def test_derived_sensors_created_via_init_channels() -> None:
     """OpenEMSEdge.init_channels populates derived_sensors from combined_sensors.json."""
     backend = _make_backend()
 
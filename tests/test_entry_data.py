@@ -2,18 +2,24 @@
 
 import asyncio
 import contextlib
+import gc
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import jsonrpc_base.jsonrpc
 import pytest
 
-from custom_components.openems.const import CURRENT_DATA_TIMEOUT_SECONDS
+from custom_components.openems.const import (
+    CURRENT_DATA_TIMEOUT_SECONDS,
+    GET_EDGES_LIMIT,
+    MAX_PARALLEL_CHANNEL_REQUESTS,
+)
 from custom_components.openems.entry_data import (
     EdgeNotDefinedError,
     OpenEMSConfigReader,
     OpenEMSWebSocketConnection,
 )
+from custom_components.openems.openems import OpenEMSBackend
 
 _CONN_PROPS = {
     "host": "testhost",
@@ -79,13 +85,36 @@ async def test_enable_reconnect_creates_task() -> None:
 
         assert conn.reconnect_task is not None
         assert isinstance(conn.reconnect_task, asyncio.Task)
-        mock_rf.assert_called_once_with(callback)
+        mock_rf.assert_called_once_with(callback, None)
 
     conn.reconnect_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await conn.reconnect_task
 
 
+async def test_enable_reconnect_keeps_running_task() -> None:
+    """A second enable_reconnect does not start another reconnect loop."""
+    conn, _ = _make_conn()
+    started = asyncio.Event()
+
+    async def _run_forever(*callbacks):
+        started.set()
+        await asyncio.Event().wait()
+
+    with patch.object(conn, "_reconnect_forever", side_effect=_run_forever) as mock_rf:
+        conn.enable_reconnect(MagicMock())
+        first_task = conn.reconnect_task
+        await started.wait()
+        conn.enable_reconnect(MagicMock())
+
+        assert conn.reconnect_task is first_task
+        mock_rf.assert_called_once()
+
+    first_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await first_task
+
+
 # ---------------------------------------------------------------------------
 # _reconnect_forever - connection-loss detection
 # ---------------------------------------------------------------------------
@@ -215,6 +244,33 @@ async def test_reconnect_forever_calls_connect_and_login_after_loss() -> None:
     login_mock.assert_called_once()
 
 
+async def test_reconnect_forever_calls_reconnected_callback_after_login() -> None:
+    """After a successful reconnect and login the reconnected callback is called."""
+    conn, _ = _make_conn()
+    conn.rpc_server_task = _done_task_mock()
+    conn.notify_data_received()
+    # stop the reconnect loop right after the first reconnect
+    reconnected = MagicMock(side_effect=asyncio.CancelledError)
+
+    async def fake_wait(tasks, *, timeout=None):
+        return (set(tasks), set())
+
+    async def fake_sleep(_seconds: float) -> None:
+        pass
+
+    with (
+        patch("asyncio.wait", fake_wait),
+        patch("asyncio.sleep", fake_sleep),
+        patch.object(conn, "connect_to_server", AsyncMock()),
+        patch.object(conn, "login_to_server", AsyncMock()),
+    ):
+        conn.enable_reconnect(MagicMock(), reconnected)
+        with contextlib.suppress(asyncio.CancelledError):
+            await conn.reconnect_task
+
+    reconnected.assert_called_once()
+
+
 async def test_reconnect_forever_extra_sleep_on_transport_error() -> None:
     """A TransportError during reconnect triggers an extra 10-second sleep."""
     conn, _ = _make_conn()
@@ -296,7 +352,7 @@ async def test_stop_cancels_reconnect_task_and_closes() -> None:
     conn, mock_server = _make_conn()
     task_started = asyncio.Event()
 
-    async def block_forever(_callback) -> None:
+    async def block_forever(*_callbacks) -> None:
         task_started.set()
         await asyncio.Event().wait()
 
@@ -476,13 +532,26 @@ class _MockJsonrpcServer:
         """Simulate a server-pushed edgeRpc notification (e.g. currentData)."""
         handler = object.__getattribute__(self, "_edgeRpc_handler")
         if handler is not None:
-            handler(payload={"method": method, "params": params})
+            handler(edgeId="0", payload={"method": method, "params": params})
 
     def push_current_data(self, params: dict) -> None:
         """Convenience wrapper: push a currentData notification."""
         self.push_notification("currentData", params)
 
 
+def _make_conn_with_jsonrpc_server() -> tuple[
+    OpenEMSWebSocketConnection, _MockJsonrpcServer
+]:
+    """Return (connection, mock_server) with a server separating handlers and calls."""
+    mock_server = _MockJsonrpcServer()
+    with patch(
+        "custom_components.openems.entry_data.jsonrpc_websocket.Server",
+        return_value=mock_server,
+    ):
+        conn = OpenEMSWebSocketConnection(_CONN_PROPS)
+    return conn, mock_server
+
+
 # ---------------------------------------------------------------------------
 # read_edges
 # ---------------------------------------------------------------------------
@@ -497,7 +566,9 @@ async def test_read_edges_returns_edges_dict() -> None:
     result = await reader.read_edges()
 
     assert result == _EDGES_RESPONSE
-    mock_server.getEdges.assert_called_once_with(page=0, limit=20, searchParams={})
+    mock_server.getEdges.assert_called_once_with(
+        page=0, limit=GET_EDGES_LIMIT, searchParams={}
+    )
 
 
 async def test_read_edges_edge_fields_match_traffic() -> None:
@@ -613,6 +684,33 @@ async def test_read_edge_channels_adds_channels_key() -> None:
     assert len(components["_componentManager"]["channels"]) == 2
 
 
+async def test_read_edge_channels_bounds_parallel_requests() -> None:
+    """_read_edge_channels sends requests concurrently, but not more than the limit."""
+    conn, mock_server = _make_conn()
+    running = 0
+    max_running = 0
+
+    async def _edge_rpc(**kwargs: object) -> dict:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return _APP_MANAGER_CHANNELS_RESPONSE
+
+    mock_server.edgeRpc = AsyncMock(side_effect=_edge_rpc)
+
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    components: dict = {
+        f"comp{i}": {"properties": {}} for i in range(2 * MAX_PARALLEL_CHANNEL_REQUESTS)
+    }
+
+    await reader.read_edge_channels(components)
+
+    assert max_running == MAX_PARALLEL_CHANNEL_REQUESTS
+    assert all("channels" in comp for comp in components.values())
+
+
 async def test_read_edge_channels_skips_component_on_transport_error() -> None:
     """_read_edge_channels removes a component when its channel fetch raises TransportError."""
     conn, mock_server = _make_conn()
@@ -784,8 +882,7 @@ async def test_get_channel_values_returns_current_data() -> None:
 
     Data from the currentData edgeRpc notification in traffic.jsonrpc.
     """
-    conn, _ = _make_conn()
-    mock_server = _MockJsonrpcServer()
+    conn, mock_server = _make_conn_with_jsonrpc_server()
 
     async def _subscribe_side_effect(edges: list) -> None:
         # The server responds to subscription by immediately pushing currentData.
@@ -793,27 +890,77 @@ async def test_get_channel_values_returns_current_data() -> None:
 
     mock_server.subscribeEdges = AsyncMock(side_effect=_subscribe_side_effect)
 
-    with patch(
-        "custom_components.openems.entry_data.jsonrpc_websocket.Server",
-        return_value=mock_server,
-    ):
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    result = await reader.get_channel_values_via_websocket(list(_CURRENT_DATA_PARAMS))
+
+    assert result == _CURRENT_DATA_PARAMS
+    # the existing connection is reused, no additional login
+    mock_server.ws_connect.assert_not_called()
+    mock_server.authenticateWithPassword.assert_not_called()
+    mock_server.close.assert_not_called()
+
+
+async def test_get_channel_values_unsubscribes_with_increasing_count() -> None:
+    """The one-shot subscription is removed again, using increasing counts."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+
+    async def _subscribe_side_effect(edges: list) -> None:
+        mock_server.push_current_data(_CURRENT_DATA_PARAMS)
+
+    mock_server.subscribeEdges = AsyncMock(side_effect=_subscribe_side_effect)
+
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    await reader.get_channel_values_via_websocket(list(_CURRENT_DATA_PARAMS))
+
+    send = object.__getattribute__(mock_server, "_edgeRpc_send")
+    payloads = [call.kwargs["payload"] for call in send.call_args_list]
+    assert [p["params"]["count"] for p in payloads] == [0, 1]
+    assert payloads[0]["params"]["channels"] == list(_CURRENT_DATA_PARAMS)
+    assert payloads[1]["params"]["channels"] == []
+    assert conn.next_subscription_count() == 2
+
+
+async def test_get_channel_values_keeps_backend_subscription() -> None:
+    """A read on a wired connection keeps the live subscription and its handler."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+    backend = OpenEMSBackend(conn, "0", False, {"_host": {"Hostname": "fems1"}})
+    live_handler = MagicMock()
+    backend.the_edge.register_channel({"ess0/Soc"}, live_handler)
+    conn.subscribed_channels = frozenset({"ess0/Soc"})
+    send = object.__getattribute__(mock_server, "_edgeRpc_send")
+
+    async def _send_side_effect(edgeId: str, payload: dict) -> None:
+        if "_host/Hostname" in payload["params"]["channels"]:
+            mock_server.push_current_data({**_CURRENT_DATA_PARAMS, "ess0/Soc": 50})
+
+    send.side_effect = _send_side_effect
+    try:
         reader = OpenEMSConfigReader(conn, edge_id="0")
         result = await reader.get_channel_values_via_websocket(
             list(_CURRENT_DATA_PARAMS)
         )
 
-    assert result == _CURRENT_DATA_PARAMS
-    mock_server.ws_connect.assert_called_once()
-    mock_server.authenticateWithPassword.assert_called_once_with(
-        username="user", password="pass"
-    )
-    mock_server.close.assert_called_once()
+        # only the requested channels are returned
+        assert result == _CURRENT_DATA_PARAMS
+        payloads = [call.kwargs["payload"] for call in send.call_args_list]
+        assert payloads[0]["params"]["channels"] == sorted(
+            [*_CURRENT_DATA_PARAMS, "ess0/Soc"]
+        )
+        assert payloads[1]["params"]["channels"] == ["ess0/Soc"]
+        mock_server.subscribeEdges.assert_not_called()
+
+        # live updates reach the backend during and after the read
+        live_handler.handle_batch_update.assert_called_once_with({"ess0/Soc": 50})
+        assert conn.edge_rpc_handler == backend.edgeRpc
+        mock_server.push_current_data({"ess0/Soc": 51})
+        live_handler.handle_batch_update.assert_called_with({"ess0/Soc": 51})
+    finally:
+        backend.the_edge.stop()
 
 
 async def test_get_channel_values_ignores_non_current_data_push() -> None:
     """Pushed edgeRpc notifications with method != 'currentData' are ignored."""
-    conn, _ = _make_conn()
-    mock_server = _MockJsonrpcServer()
+    conn, mock_server = _make_conn_with_jsonrpc_server()
 
     async def _subscribe_side_effect(edges: list) -> None:
         # First push an unrelated method - must be ignored.
@@ -823,22 +970,107 @@ async def test_get_channel_values_ignores_non_current_data_push() -> None:
 
     mock_server.subscribeEdges = AsyncMock(side_effect=_subscribe_side_effect)
 
-    with patch(
-        "custom_components.openems.entry_data.jsonrpc_websocket.Server",
-        return_value=mock_server,
-    ):
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    result = await reader.get_channel_values_via_websocket(list(_CURRENT_DATA_PARAMS))
+
+    assert result == _CURRENT_DATA_PARAMS
+
+
+async def test_get_channel_values_shares_concurrent_identical_reads() -> None:
+    """Concurrent reads of the same channels are served by one subscription."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+
+    async def _subscribe_side_effect(edges: list) -> None:
+        await asyncio.sleep(0)
+        mock_server.push_current_data(_CURRENT_DATA_PARAMS)
+
+    mock_server.subscribeEdges = AsyncMock(side_effect=_subscribe_side_effect)
+
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    channels = list(_CURRENT_DATA_PARAMS)
+    results = await asyncio.gather(
+        reader.get_channel_values_via_websocket(channels),
+        reader.get_channel_values_via_websocket(list(reversed(channels))),
+    )
+
+    assert results == [_CURRENT_DATA_PARAMS, _CURRENT_DATA_PARAMS]
+    mock_server.subscribeEdges.assert_called_once()
+    assert reader._pending_channel_reads == {}
+
+
+async def test_get_channel_values_serializes_different_reads() -> None:
+    """Concurrent reads of different channels run one after the other."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+    loop = asyncio.get_running_loop()
+    send = object.__getattribute__(mock_server, "_edgeRpc_send")
+
+    async def _send_side_effect(edgeId: str, payload: dict) -> None:
+        if channels := payload["params"]["channels"]:
+            # the edge pushes the values of the subscribed channels later on
+            values = {channel: _CURRENT_DATA_PARAMS[channel] for channel in channels}
+            loop.call_soon(mock_server.push_current_data, values)
+
+    send.side_effect = _send_side_effect
+
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    results = await asyncio.gather(
+        reader.get_channel_values_via_websocket(["_host/Hostname"]),
+        reader.get_channel_values_via_websocket(["ess0/_PropertyAlias"]),
+    )
+
+    assert results == [
+        {"_host/Hostname": "fems1"},
+        {"ess0/_PropertyAlias": "Storage system"},
+    ]
+    payloads = [call.kwargs["payload"] for call in send.call_args_list]
+    assert [p["params"]["channels"] for p in payloads] == [
+        ["_host/Hostname"],
+        [],
+        ["ess0/_PropertyAlias"],
+        [],
+    ]
+
+
+async def test_get_channel_values_retrieves_error_of_abandoned_read() -> None:
+    """A failing read whose callers were all cancelled does not log an error."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+    read_started = asyncio.Event()
+    fail_read = asyncio.Event()
+
+    async def _subscribe_side_effect(edges: list) -> None:
+        read_started.set()
+        await fail_read.wait()
+        raise jsonrpc_base.jsonrpc.TransportError("Connection lost")
+
+    mock_server.subscribeEdges = AsyncMock(side_effect=_subscribe_side_effect)
+    loop = asyncio.get_running_loop()
+    exception_handler = MagicMock()
+    loop.set_exception_handler(exception_handler)
+    try:
         reader = OpenEMSConfigReader(conn, edge_id="0")
-        result = await reader.get_channel_values_via_websocket(
-            list(_CURRENT_DATA_PARAMS)
+        caller = asyncio.create_task(
+            reader.get_channel_values_via_websocket(["_host/Hostname"])
         )
+        await read_started.wait()
+        (read_task,) = reader._pending_channel_reads.values()
+        caller.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await caller
 
-    assert result == _CURRENT_DATA_PARAMS
+        fail_read.set()
+        await asyncio.wait([read_task])
+        await asyncio.sleep(0)
+        del read_task
+        gc.collect()
+
+        exception_handler.assert_not_called()
+    finally:
+        loop.set_exception_handler(None)
 
 
 async def test_get_channel_values_timeout_raises() -> None:
     """get_channel_values_via_websocket raises TimeoutError when no data arrives."""
-    conn, _ = _make_conn()
-    mock_server = _MockJsonrpcServer()
+    conn, _ = _make_conn_with_jsonrpc_server()
     # subscribeEdges does nothing → currentData is never pushed → wait_for times out
 
     async def _fake_wait_for(coro: object, *, timeout: float) -> None:
@@ -847,13 +1079,58 @@ async def test_get_channel_values_timeout_raises() -> None:
             coro.close()
         raise TimeoutError
 
-    with (
-        patch(
-            "custom_components.openems.entry_data.jsonrpc_websocket.Server",
-            return_value=mock_server,
-        ),
-        patch("asyncio.wait_for", new=_fake_wait_for),
-    ):
+    with patch("asyncio.wait_for", new=_fake_wait_for):
+        reader = OpenEMSConfigReader(conn, edge_id="0")
+        with pytest.raises(TimeoutError):
+            await reader.get_channel_values_via_websocket(["_host/Hostname"])
+
+
+async def test_get_channel_values_timeout_restores_live_subscription() -> None:
+    """A timed out read restores the live subscription and the previous handler."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+    live_handler = MagicMock()
+    conn.set_edge_rpc_handler(live_handler)
+    conn.subscribed_channels = frozenset({"ess0/Soc"})
+    send = object.__getattribute__(mock_server, "_edgeRpc_send")
+
+    async def _fake_wait_for(coro: object, *, timeout: float) -> None:
+        if hasattr(coro, "close"):
+            coro.close()
+        raise TimeoutError
+
+    with patch("asyncio.wait_for", new=_fake_wait_for):
         reader = OpenEMSConfigReader(conn, edge_id="0")
         with pytest.raises(TimeoutError):
             await reader.get_channel_values_via_websocket(["_host/Hostname"])
+
+    payloads = [call.kwargs["payload"] for call in send.call_args_list]
+    assert [p["params"]["channels"] for p in payloads] == [
+        ["_host/Hostname", "ess0/Soc"],
+        ["ess0/Soc"],
+    ]
+    assert conn.edge_rpc_handler is live_handler
+
+
+async def test_get_channel_values_ignores_push_of_live_channels() -> None:
+    """A push sent before the read subscription applies does not end the read."""
+    conn, mock_server = _make_conn_with_jsonrpc_server()
+    conn.subscribed_channels = frozenset({"_host/Hostname"})
+    send = object.__getattribute__(mock_server, "_edgeRpc_send")
+
+    async def _send_side_effect(edgeId: str, payload: dict) -> None:
+        if "ess0/_PropertyAlias" in payload["params"]["channels"]:
+            # still the live subscription only
+            mock_server.push_current_data({"_host/Hostname": "fems1"})
+            mock_server.push_current_data(_CURRENT_DATA_PARAMS)
+
+    send.side_effect = _send_side_effect
+
+    reader = OpenEMSConfigReader(conn, edge_id="0")
+    result = await reader.get_channel_values_via_websocket(
+        ["_host/Hostname", "ess0/_PropertyAlias"]
+    )
+
+    assert result == {
+        "_host/Hostname": "fems1",
+        "ess0/_PropertyAlias": "Storage system",
+    }
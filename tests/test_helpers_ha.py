@@ -20,7 +20,7 @@ def test_unit_description_various() -> None:
     assert ud.unit == "°C"
 
 
-def test_translation_key_and_find_channel(dummy_backend) -> None:
+async def test_translation_key_and_find_channel(dummy_backend) -> None:
     """Create a component/channel and ensure helper finds it and returns translation key."""
     component_json = {
         "_PropertyAlias": "a",
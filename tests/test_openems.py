@@ -3,16 +3,23 @@
 These tests exercise the OpenEMS channel/property/component logic without
 network calls by using small dummy objects.
 """
+import asyncio
 from datetime import time
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+import uuid
 
 from homeassistant.core import HomeAssistant
+from jinja2 import Template
+import pytest
 from yarl import URL
 
 from custom_components.openems import openems
 from custom_components.openems.const import SLASH_ESC
 from custom_components.openems.helpers import wrap_jsonrpc
-from custom_components.openems.helpers_openems import prepare_ref_value
+from custom_components.openems.helpers_openems import (
+    NumericExpression,
+    prepare_ref_value,
+)
 
 
 def _make_backend():
@@ -21,6 +28,8 @@ def _make_backend():
     backend.multi_edge = False
     backend.connection.conn_url = URL("ws://localhost:8085/openems-backend-ui")
     backend.connection.notify_data_received = MagicMock()
+    backend.connection.subscribed_channels = frozenset()
+    backend.connection.seconds_since_data_received = MagicMock(return_value=0.0)
     return backend
 
 
@@ -45,9 +54,11 @@ def test_wrap_jsonrpc() -> None:
     assert env["method"] == "testMethod"
     assert "id" in env
     assert env["params"]["a"] == 1
+    # OpenEMS only accepts the canonical, hyphenated UUID form
+    assert str(uuid.UUID(env["id"])) == env["id"]
 
 
-def test_edge_dispatch_currentData() -> None:
+async def test_edge_dispatch_currentData() -> None:
     """Test that currentData updates current_channel_data on the edge."""
     backend = _make_backend()
     component_config = {"_host": {"Hostname": "h1"}}
@@ -60,7 +71,27 @@ def test_edge_dispatch_currentData() -> None:
         edge.stop()
 
 
-def test_component_boolean_property() -> None:
+async def test_edge_stop_cancels_rest_updates() -> None:
+    """Test stopping the edge ends cyclic REST updates before the session closes."""
+    backend = _make_backend()
+    comp_json = {
+        "properties": {},
+        "channels": [make_channel_json("SomeSensor", "INTEGER")],
+    }
+    component_config = {"_host": {"Hostname": "h1"}, "comp1": comp_json}
+    edge = openems.OpenEMSEdge(backend, "edge-1", component_config)
+    (sensor,) = edge.components["comp1"].sensors
+    rest_update_task = asyncio.create_task(asyncio.sleep(3600))
+    sensor._rest_update_task = rest_update_task
+
+    edge.stop()
+    await asyncio.sleep(0)
+
+    assert rest_update_task.cancelled()
+    assert sensor._rest_update_task is None
+
+
+async def test_component_boolean_property() -> None:
     """Test that a BOOLEAN _Property channel is created and handles data."""
     backend = _make_backend()
     comp_json = {
@@ -139,6 +170,17 @@ def test_number_property_multiplier_and_limits() -> None:
     assert prop.current_value == 20
 
 
+def test_number_property_step_at_powers_of_10() -> None:
+    """Test the step is the smallest power of 10 giving at most STEPS steps."""
+    comp = _make_component()
+    num_json = {"id": "_PropertyEnergySessionLimit", "type": "INTEGER", "unit": "W"}
+    for upper, step in (("200000", 1000), ("200001", 10000), ("2000", 10), ("1", 1)):
+        prop = openems.OpenEMSNumberProperty(component=comp, channel_json=num_json)
+        prop.set_limit_def({"lower": "0", "upper": upper})
+        assert prop.step == step
+        assert prop.upper_limit % step == 0
+
+
 def _make_component_with_edge(name: str = "ctrlEvcs1"):
     """Return a mock component with a real DummyEdge supporting register/unregister."""
     comp = MagicMock()
@@ -183,7 +225,77 @@ def test_channel_register_unregister_and_notify() -> None:
     assert chan.callback is None
 
 
-def test_set_unavailable_clears_values() -> None:
+async def test_subscription_updater_subscribes_on_register() -> None:
+    """Test registrations trigger one subscription without polling delay."""
+    backend = _make_backend()
+    rpc_server = backend.connection.rpc_server
+    rpc_server.connected = True
+    rpc_server.subscribeEdges = AsyncMock()
+    rpc_server.edgeRpc = AsyncMock()
+    edge = openems.OpenEMSEdge(backend, "e1", {"_host": {"Hostname": "h1"}})
+    try:
+        edge.register_channel({"c1/S"}, MagicMock())
+        await asyncio.sleep(0)
+        # registered within the debounce interval, sent with the same request
+        edge.register_channel({"c1/T"}, MagicMock())
+        updater_class = openems.OpenEMSEdge.OpenEmsEdgeChannelSubscriptionUpdater
+        await asyncio.sleep(2 * updater_class.DEBOUNCE_INTERVAL)
+
+        rpc_server.subscribeEdges.assert_awaited_once_with(edges=["e1"])
+        rpc_server.edgeRpc.assert_awaited_once()
+        payload = rpc_server.edgeRpc.await_args.kwargs["payload"]
+        assert payload["method"] == "subscribeChannels"
+        assert payload["params"]["channels"] == ["c1/S", "c1/T"]
+    finally:
+        edge.stop()
+
+
+async def test_unregister_channel_keeps_other_handlers() -> None:
+    """Test unregistering a handler only removes its own channel registrations."""
+    backend = _make_backend()
+    edge = openems.OpenEMSEdge(backend, "e1", {"_host": {"Hostname": "h1"}})
+    try:
+        first, second = MagicMock(), MagicMock()
+        edge.register_channel({"c1/A", "c1/B"}, first)
+        edge.register_channel({"c1/B"}, second)
+
+        edge.unregister_channel(first)
+        assert edge.registered_channels == {"c1/B": (second,)}
+
+        edge.unregister_channel(second)
+        assert edge.registered_channels == {}
+    finally:
+        edge.stop()
+
+
+async def test_backend_dispatches_edge_callbacks(caplog) -> None:
+    """Test edgeRpc forwards known methods and logs unknown methods and edges once."""
+    connection = MagicMock()
+    connection.conn_url = URL("ws://localhost:8085/")
+    backend = openems.OpenEMSBackend(
+        connection, "e1", False, {"_host": {"Hostname": "h1"}}
+    )
+    try:
+        backend.edgeRpc(
+            edgeId="e1", payload={"method": "currentData", "params": {"a/b": 1}}
+        )
+        assert backend.the_edge.current_channel_data == {"a/b": 1}
+
+        for _ in range(2):
+            backend.edgeRpc(edgeId="e1", payload={"method": "unknown", "params": {}})
+        assert caplog.text.count("Unhandled callback method: unknown") == 1
+
+        for _ in range(2):
+            backend.edgeRpc(
+                edgeId="e2", payload={"method": "currentData", "params": {"a/b": 2}}
+            )
+        assert caplog.text.count("undefined edge: e2") == 1
+        assert backend.the_edge.current_channel_data == {"a/b": 1}
+    finally:
+        backend.the_edge.stop()
+
+
+async def test_set_unavailable_clears_values() -> None:
     """Test that set_unavailable calls handle_data_update(None) for active channels."""
     backend = _make_backend()
     component_config = {"_host": {"Hostname": "h1"}}
@@ -194,7 +306,7 @@ def test_set_unavailable_clears_values() -> None:
         ch = openems.OpenEMSChannel(component=comp, channel_json=chan_json)
 
         # Register the channel directly in the edge handler map
-        edge._registered_handlers["c1/S"] = {ch}
+        edge._registered_handlers["c1/S"] = (ch,)
         edge.current_channel_data = {"c1/S": 5}
 
         edge.set_unavailable()
@@ -203,6 +315,70 @@ def test_set_unavailable_clears_values() -> None:
         edge.stop()
 
 
+async def test_connection_lost_keeps_values_until_grace_period_ends() -> None:
+    """Test that connection_lost defers set_unavailable and new data cancels it."""
+    backend = _make_backend()
+    component_config = {"_host": {"Hostname": "h1"}}
+    edge = openems.OpenEMSEdge(backend, "e1", component_config)
+    try:
+        comp = _make_component_with_edge()
+        chan_json = {"id": "S", "type": "INTEGER", "unit": "u"}
+        ch = openems.OpenEMSChannel(component=comp, channel_json=chan_json)
+        edge._registered_handlers["c1/S"] = (ch,)
+        edge.currentData({"c1/S": 5})
+
+        with patch.object(openems, "UNAVAILABLE_GRACE_PERIOD_SECONDS", 0.01):
+            edge.connection_lost()
+            assert ch.current_value == 5
+            # data received again before the grace period ended
+            edge.currentData({"c1/S": 6})
+            await asyncio.sleep(0.05)
+            assert ch.current_value == 6
+
+            # reconnected before the grace period ended
+            edge.connection_lost()
+            edge.connection_restored()
+            await asyncio.sleep(0.05)
+            assert ch.current_value == 6
+
+            edge.connection_lost()
+            await asyncio.sleep(0.05)
+            assert ch.current_value is None
+    finally:
+        edge.stop()
+
+
+async def test_connection_lost_grace_period_starts_with_last_data() -> None:
+    """Test a loss detected after the grace period sets entities unavailable at once."""
+    backend = _make_backend()
+    backend.connection.seconds_since_data_received.return_value = 60.0
+    edge = openems.OpenEMSEdge(backend, "e1", {"_host": {"Hostname": "h1"}})
+    try:
+        comp = _make_component_with_edge()
+        chan_json = {"id": "S", "type": "INTEGER", "unit": "u"}
+        ch = openems.OpenEMSChannel(component=comp, channel_json=chan_json)
+        edge._registered_handlers["c1/S"] = (ch,)
+        edge.currentData({"c1/S": 5})
+
+        edge.connection_lost()
+        assert ch.current_value is None
+    finally:
+        edge.stop()
+
+
+async def test_stop_cancels_unavailable_timer() -> None:
+    """Test stopping the edge cancels a pending grace period."""
+    backend = _make_backend()
+    edge = openems.OpenEMSEdge(backend, "e1", {"_host": {"Hostname": "h1"}})
+    edge.connection_lost()
+    timer = edge._unavailable_timer
+    assert timer is not None
+
+    edge.stop()
+    assert timer.cancelled()
+    assert edge._unavailable_timer is None
+
+
 def test_number_property_with_template_references() -> None:
     """Test OpenEMSNumberProperty with template references to other channels."""
     comp = _make_component_with_edge("evcs1")
@@ -229,6 +405,70 @@ def test_number_property_with_template_references() -> None:
     assert num_prop.multiplier == 3.0
 
 
+def test_number_property_batch_update_calculates_config_once() -> None:
+    """Test a batch of reference updates triggers a single config calculation."""
+    comp = _make_component_with_edge("evcs1")
+    num_json = {"id": "_PropertyForceChargeMinPower", "type": "INTEGER", "unit": "W"}
+    num_prop = openems.OpenEMSNumberProperty(component=comp, channel_json=num_json)
+    num_prop.set_multiplier_def("{{Phases}}")
+    num_prop.set_limit_def({"lower": "{{MinimumPower}}", "upper": "100000"})
+
+    with patch.object(
+        openems.OpenEMSNumberProperty,
+        "_update_config",
+        autospec=True,
+        side_effect=openems.OpenEMSNumberProperty._update_config,
+    ) as update_config:
+        num_prop.handle_batch_update(
+            {
+                "evcs1/Phases": 3,
+                "evcs1/MinimumPower": 1000,
+                "evcs1/_PropertyForceChargeMinPower": 2000,
+            }
+        )
+
+    update_config.assert_called_once()
+    assert num_prop.multiplier == 3.0
+    assert num_prop.current_value == 6000
+
+
+def test_prepare_ref_value_numeric_expression() -> None:
+    """Test plain arithmetic is evaluated without jinja."""
+    comp = _make_component("battery0")
+    expr, refs = prepare_ref_value("{{MaxCellVoltage}} - {{MinCellVoltage}}", comp)
+    assert isinstance(expr, NumericExpression)
+    assert expr.render(dict(zip(refs, (3400, 3300), strict=True))) == 100
+
+
+def test_prepare_ref_value_falls_back_to_template() -> None:
+    """Test expressions using jinja features keep a jinja template."""
+    comp = _make_component("battery0")
+    expr, refs = prepare_ref_value("[{{Cell1Voltage}}, {{Cell2Voltage}}] | max", comp)
+    assert isinstance(expr, Template)
+    assert float(expr.render(dict(zip(refs, (3300, 3400), strict=True)))) == 3400
+
+    expr, _ = prepare_ref_value("{{Cell1Voltage}}.__class__", comp)
+    assert isinstance(expr, Template)
+
+
+def test_prepare_ref_value_undefined_name_keeps_template() -> None:
+    """Test names which are no channel references still render as empty string."""
+    comp = _make_component("battery0")
+    expr, refs = prepare_ref_value("UnknownChannel", comp)
+    assert isinstance(expr, Template)
+    assert refs == []
+    with pytest.raises(ValueError):
+        float(expr.render({}))
+
+
+def test_prepare_ref_value_shares_compiled_expressions() -> None:
+    """Test the same expression is compiled only once."""
+    comp = _make_component("battery0")
+    first, _ = prepare_ref_value("{{MaxCellVoltage}} - {{MinCellVoltage}}", comp)
+    second, _ = prepare_ref_value("{{MaxCellVoltage}} - {{MinCellVoltage}}", comp)
+    assert first is second
+
+
 async def test_entity_lifecycle_and_unique_id(hass: HomeAssistant, dummy_backend) -> None:
     """Test entities are prepared and unique_ids are stable."""
     comp = {